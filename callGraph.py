@@ -0,0 +1,401 @@
+import hashlib
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from readFile import SourceCodeProcessor
+
+
+# Bump whenever the summariser's rules change so cached summaries from older rules are not reused
+SUMMARY_ALGORITHM_VERSION = 2
+MAX_CACHED_COMPONENTS = 2048
+# Below this many uncached components in a level, worker start-up and pickling outweigh the work
+PARALLEL_COMPONENT_THRESHOLD = 32
+
+CALL_PATTERN = re.compile(r"\b([A-Za-z_]\w*)\s*\(")
+LVALUE_SUFFIX = r"((?:\s*(?:->|\.)\s*[A-Za-z_]\w*|\s*\[[^\]]*\])*)"
+ASSIGNMENT_TARGET_PATTERN = re.compile(r"(\*\s*)?\b([A-Za-z_]\w*)" + LVALUE_SUFFIX + r"\s*(?:[+\-*/%&|^]|<<|>>)?=(?!=)")
+PRE_INCREMENT_PATTERN = re.compile(r"(?:\+\+|--)\s*(\*\s*)?\b([A-Za-z_]\w*)" + LVALUE_SUFFIX)
+POST_INCREMENT_PATTERN = re.compile(r"(\*\s*)?\b([A-Za-z_]\w*)" + LVALUE_SUFFIX + r"\s*(?:\+\+|--)")
+ARGUMENT_TARGET_PATTERN = re.compile(r"^(&\s*)?([A-Za-z_]\w*)" + LVALUE_SUFFIX + r"$")
+
+
+@dataclass
+class FunctionDefinition:
+    """Represents a function definition extracted from a source file"""
+    functionName: str
+    parameters: List[Tuple[str, bool]]
+    functionBody: str
+    startingLine: int
+
+    @property
+    def parameterNames(self) -> List[str]:
+        """Names of the formal parameters in declaration order"""
+        return [parameterName for parameterName, _ in self.parameters]
+
+
+@dataclass
+class FunctionSummary:
+    """Represents the globals and parameters a function may define, including through its callees"""
+    functionName: str
+    definedGlobals: Set[str] = field(default_factory=set)
+    definedParameters: Set[int] = field(default_factory=set)
+
+
+@dataclass
+class CallGraph:
+    """Represents the calls between functions defined in a single source file"""
+    functionDefinitions: Dict[str, FunctionDefinition]
+    globalVariables: Set[str]
+    calleeMap: Dict[str, Set[str]]
+
+    def computeStronglyConnectedComponents(self) -> List[List[str]]:
+        """Find SCCs with Tarjan's algorithm; callees are emitted before their callers"""
+        discoveryIndex: Dict[str, int] = {}
+        lowLink: Dict[str, int] = {}
+        pendingStack: List[str] = []
+        onStack: Set[str] = set()
+        components: List[List[str]] = []
+
+        def visitFunction(functionName: str) -> None:
+            discoveryIndex[functionName] = lowLink[functionName] = len(discoveryIndex)
+            pendingStack.append(functionName)
+            onStack.add(functionName)
+
+            for calleeName in sorted(self.calleeMap[functionName]):
+                if calleeName not in discoveryIndex:
+                    visitFunction(calleeName)
+                    lowLink[functionName] = min(lowLink[functionName], lowLink[calleeName])
+                elif calleeName in onStack:
+                    lowLink[functionName] = min(lowLink[functionName], discoveryIndex[calleeName])
+
+            if lowLink[functionName] == discoveryIndex[functionName]:
+                component = []
+                while True:
+                    memberName = pendingStack.pop()
+                    onStack.discard(memberName)
+                    component.append(memberName)
+                    if memberName == functionName:
+                        break
+                components.append(sorted(component))
+
+        for functionName in self.functionDefinitions:
+            if functionName not in discoveryIndex:
+                visitFunction(functionName)
+
+        return components
+
+    def groupComponentsByLevel(self) -> List[List[List[str]]]:
+        """Group SCCs so that components within a level never call each other"""
+        componentLevels: Dict[str, int] = {}
+        levelGroups: List[List[List[str]]] = []
+
+        for component in self.computeStronglyConnectedComponents():
+            externalCallees = {callee for member in component for callee in self.calleeMap[member]} - set(component)
+            level = max((componentLevels[callee] + 1 for callee in externalCallees), default=0)
+            for memberName in component:
+                componentLevels[memberName] = level
+            while len(levelGroups) <= level:
+                levelGroups.append([])
+            levelGroups[level].append(component)
+
+        return levelGroups
+
+
+class SummaryCache:
+    """Persists function summaries across runs, keyed by a fingerprint of their inputs
+
+    Entries are kept in least-recently-used order and capped at MAX_CACHED_COMPONENTS on save,
+    so runs over different files share the cache without it growing forever.
+    """
+
+    def __init__(self, cachePath: Optional[Path] = None) -> None:
+        self.cachePath = cachePath
+        self.cachedEntries: Dict[str, Dict[str, Dict[str, List]]] = {}
+
+        if cachePath is not None and cachePath.exists():
+            try:
+                loadedEntries = json.loads(cachePath.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                loadedEntries = None
+            if self.isWellFormed(loadedEntries):
+                self.cachedEntries = loadedEntries
+            else:
+                print(f"Unreadable summary cache {cachePath}. Summaries will be recomputed.")
+
+    @staticmethod
+    def isWellFormed(loadedEntries: object) -> bool:
+        """Check that loaded JSON has the componentKey -> function -> summary shape"""
+        if not isinstance(loadedEntries, dict):
+            return False
+        for cachedComponent in loadedEntries.values():
+            if not isinstance(cachedComponent, dict):
+                return False
+            for entry in cachedComponent.values():
+                if not (isinstance(entry, dict) and isinstance(entry.get("globals"), list)
+                        and isinstance(entry.get("parameters"), list)):
+                    return False
+                if not all(isinstance(globalName, str) for globalName in entry["globals"]):
+                    return False
+                if not all(type(parameterIndex) is int and parameterIndex >= 0
+                           for parameterIndex in entry["parameters"]):
+                    return False
+        return True
+
+    def lookup(self, componentKey: str) -> Optional[Dict[str, FunctionSummary]]:
+        """Return cached summaries for a component, if present"""
+        cachedComponent = self.cachedEntries.pop(componentKey, None)
+        if cachedComponent is None:
+            return None
+        self.cachedEntries[componentKey] = cachedComponent
+        return {functionName: FunctionSummary(functionName, set(entry["globals"]), set(entry["parameters"]))
+                for functionName, entry in cachedComponent.items()}
+
+    def store(self, componentKey: str, componentSummaries: Dict[str, FunctionSummary]) -> None:
+        """Record freshly computed summaries for a component"""
+        self.cachedEntries.pop(componentKey, None)
+        self.cachedEntries[componentKey] = {
+            functionName: {"globals": sorted(summary.definedGlobals),
+                           "parameters": sorted(summary.definedParameters)}
+            for functionName, summary in componentSummaries.items()
+        }
+
+    def save(self) -> None:
+        """Write the most recently used entries back to disk, evicting the oldest beyond the cap"""
+        if self.cachePath is None:
+            return
+        retainedKeys = list(self.cachedEntries)[-MAX_CACHED_COMPONENTS:]
+        retainedEntries = {componentKey: self.cachedEntries[componentKey] for componentKey in retainedKeys}
+        self.cachePath.parent.mkdir(parents=True, exist_ok=True)
+        self.cachePath.write_text(json.dumps(retainedEntries, indent=2), encoding="utf-8")
+
+
+def findCallSites(statementText: str) -> List[Tuple[str, List[str]]]:
+    """Extract (callee, argument list) pairs for every call in a statement, including nested calls"""
+    cleanedStatement = SourceCodeProcessor.blankLiterals(statementText)
+    callSites = []
+
+    for callMatch in CALL_PATTERN.finditer(cleanedStatement):
+        calleeName = callMatch.group(1)
+        if calleeName in SourceCodeProcessor.CONTROL_KEYWORDS:
+            continue
+
+        nestingLevel, currentPos = 1, callMatch.end()
+        while currentPos < len(cleanedStatement) and nestingLevel:
+            if cleanedStatement[currentPos] == '(':
+                nestingLevel += 1
+            elif cleanedStatement[currentPos] == ')':
+                nestingLevel -= 1
+            currentPos += 1
+
+        argumentText = cleanedStatement[callMatch.end():currentPos - 1]
+        callSites.append((calleeName, SourceCodeProcessor.splitTopLevel(argumentText)))
+
+    return callSites
+
+
+def resolveArgumentTarget(argumentText: str) -> Optional[Tuple[str, bool]]:
+    """Map an actual argument to (base variable, whether a callee write escapes to it through a pointer)"""
+    argumentMatch = ARGUMENT_TARGET_PATTERN.match(argumentText.strip())
+    if not argumentMatch:
+        return None
+
+    takesAddress, accessSuffix = bool(argumentMatch.group(1)), argumentMatch.group(3)
+    reachesThroughPointer = not takesAddress or "->" in accessSuffix or "[" in accessSuffix
+    return argumentMatch.group(2), reachesThroughPointer
+
+
+def resolveArgumentStorage(argumentText: str, arrayNames: Set[str]) -> Optional[str]:
+    """Return the variable whose own storage a callee writes through this argument, if any"""
+    argumentMatch = ARGUMENT_TARGET_PATTERN.match(argumentText.strip())
+    if not argumentMatch:
+        return None
+
+    takesAddress, baseName, accessSuffix = bool(argumentMatch.group(1)), argumentMatch.group(2), argumentMatch.group(3)
+    if "->" in accessSuffix:
+        return None
+    if takesAddress:
+        # &v and &arr[i] point into the variable; &ptr[i] points into whatever ptr addresses
+        return baseName if "[" not in accessSuffix or baseName in arrayNames else None
+    # A plain argument only carries the variable's storage when an array decays to a pointer
+    return baseName if baseName in arrayNames else None
+
+
+def collectDeclarations(bodyLines: Iterable[str]) -> Dict[str, bool]:
+    """Collect name -> isArray for everything declared in a function body, including for-loop initialisers"""
+    declarations: Dict[str, bool] = {}
+    for line in bodyLines:
+        for statementText in SourceCodeProcessor.blankLiterals(line).split(";"):
+            statementText = re.sub(r"^[\s{}]*(?:for\s*\()?", "", statementText)
+            for declaredName, isArray in SourceCodeProcessor.parseDeclarators(statementText):
+                declarations[declaredName] = declarations.get(declaredName, False) or isArray
+    return declarations
+
+
+def collectDeclaredNames(bodyLines: Iterable[str]) -> Set[str]:
+    """Collect the names declared anywhere in a function body, including for-loop initialisers"""
+    return set(collectDeclarations(bodyLines))
+
+
+def parseWriteTargets(statementText: str) -> List[Tuple[str, bool]]:
+    """Extract (base variable, written through pointer) pairs for assignments and increments"""
+    cleanedStatement = SourceCodeProcessor.blankLiterals(statementText)
+    writeTargets = []
+
+    for targetPattern in (ASSIGNMENT_TARGET_PATTERN, PRE_INCREMENT_PATTERN, POST_INCREMENT_PATTERN):
+        for targetMatch in targetPattern.finditer(cleanedStatement):
+            dereferences, baseName, accessSuffix = targetMatch.groups()
+            writesThroughPointer = bool(dereferences) or "->" in accessSuffix or "[" in accessSuffix
+            writeTargets.append((baseName, writesThroughPointer))
+
+    return writeTargets
+
+
+class FunctionSummarizer:
+    """Computes function summaries bottom-up over the SCCs of a call graph"""
+
+    def __init__(self, callGraph: CallGraph) -> None:
+        self.callGraph = callGraph
+
+    def summarizeAll(self, summaryCache: Optional[SummaryCache] = None,
+                     maxWorkers: Optional[int] = None) -> Dict[str, FunctionSummary]:
+        """Summarise every function bottom-up over the SCCs of the call graph
+
+        Uncached components of a level are independent of each other. They are summarised in worker
+        processes only when maxWorkers allows more than one worker, or when a level has at least
+        PARALLEL_COMPONENT_THRESHOLD of them; otherwise they run serially in this process.
+        """
+        functionSummaries: Dict[str, FunctionSummary] = {}
+        executor: Optional[ProcessPoolExecutor] = None
+
+        try:
+            for levelComponents in self.callGraph.groupComponentsByLevel():
+                # Cache lookups stay in this process; only the misses are computed
+                pendingComponents = []
+                for component in levelComponents:
+                    componentKey = self.computeComponentKey(component, functionSummaries)
+                    cachedSummaries = summaryCache.lookup(componentKey) if summaryCache is not None else None
+                    if cachedSummaries is not None:
+                        functionSummaries.update(cachedSummaries)
+                    else:
+                        pendingComponents.append((componentKey, component))
+
+                pendingList = [component for _, component in pendingComponents]
+                useWorkers = (maxWorkers > 1 if maxWorkers is not None
+                              else len(pendingList) >= PARALLEL_COMPONENT_THRESHOLD)
+                if len(pendingList) > 1 and useWorkers:
+                    executor = executor or ProcessPoolExecutor(max_workers=maxWorkers)
+                    computedLevel = list(executor.map(self.summarizeComponent, pendingList,
+                                                      repeat(functionSummaries)))
+                else:
+                    computedLevel = [self.summarizeComponent(component, functionSummaries)
+                                     for component in pendingList]
+
+                for (componentKey, _), componentSummaries in zip(pendingComponents, computedLevel):
+                    functionSummaries.update(componentSummaries)
+                    if summaryCache is not None:
+                        summaryCache.store(componentKey, componentSummaries)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return functionSummaries
+
+    def computeComponentKey(self, component: List[str], knownSummaries: Dict[str, FunctionSummary]) -> str:
+        """Fingerprint a component by its own code and the summaries of the callees it depends on"""
+        externalCallees = sorted({callee for member in component
+                                  for callee in self.callGraph.calleeMap[member]} - set(component))
+        fingerprintInput = {
+            "version": SUMMARY_ALGORITHM_VERSION,
+            "functions": [[memberName,
+                           self.callGraph.functionDefinitions[memberName].parameters,
+                           self.callGraph.functionDefinitions[memberName].functionBody]
+                          for memberName in component],
+            "globals": sorted(self.callGraph.globalVariables),
+            "callees": [[calleeName,
+                         sorted(knownSummaries[calleeName].definedGlobals),
+                         sorted(knownSummaries[calleeName].definedParameters)]
+                        for calleeName in externalCallees],
+        }
+        return hashlib.sha256(json.dumps(fingerprintInput).encode("utf-8")).hexdigest()
+
+    def summarizeComponent(self, component: List[str],
+                           knownSummaries: Dict[str, FunctionSummary]) -> Dict[str, FunctionSummary]:
+        """Iterate summaries of mutually recursive functions to a fixed point"""
+        componentSummaries = {memberName: FunctionSummary(memberName) for memberName in component}
+        hasChanges = True
+
+        while hasChanges:
+            hasChanges = False
+            visibleSummaries = {**knownSummaries, **componentSummaries}
+            for memberName in component:
+                updatedSummary = self.summarizeFunction(self.callGraph.functionDefinitions[memberName],
+                                                        visibleSummaries)
+                currentSummary = componentSummaries[memberName]
+                if (updatedSummary.definedGlobals != currentSummary.definedGlobals or
+                        updatedSummary.definedParameters != currentSummary.definedParameters):
+                    componentSummaries[memberName] = updatedSummary
+                    hasChanges = True
+
+        return componentSummaries
+
+    def summarizeFunction(self, definition: FunctionDefinition,
+                          knownSummaries: Dict[str, FunctionSummary]) -> FunctionSummary:
+        """Collect the globals and pointer parameters a single function may define"""
+        summary = FunctionSummary(definition.functionName)
+        parameterIndices = {parameterName: index for index, parameterName in enumerate(definition.parameterNames)}
+        bodyLines = [line.strip() for line in definition.functionBody.splitlines() if line.strip()]
+
+        # Locals shadow globals of the same name
+        localNames = collectDeclaredNames(bodyLines)
+
+        def recordWrite(baseName: str, writesThroughPointer: bool) -> None:
+            if baseName in parameterIndices:
+                if writesThroughPointer:
+                    summary.definedParameters.add(parameterIndices[baseName])
+            elif baseName in self.callGraph.globalVariables and baseName not in localNames:
+                summary.definedGlobals.add(baseName)
+
+        for line in bodyLines:
+            for baseName, writesThroughPointer in parseWriteTargets(line):
+                recordWrite(baseName, writesThroughPointer)
+
+            for calleeName, callArguments in findCallSites(line):
+                calleeSummary = knownSummaries.get(calleeName)
+                if calleeSummary is None:
+                    continue
+                summary.definedGlobals.update(calleeSummary.definedGlobals)
+                for parameterIndex in calleeSummary.definedParameters:
+                    if parameterIndex < len(callArguments):
+                        argumentTarget = resolveArgumentTarget(callArguments[parameterIndex])
+                        if argumentTarget:
+                            recordWrite(*argumentTarget)
+
+        return summary
+
+
+def constructCallGraph(sourceCode: str) -> CallGraph:
+    """Build the call graph for all functions defined in preprocessed source code"""
+    functionDefinitions = {
+        functionName: FunctionDefinition(functionName, parameters, functionBody, startingLine)
+        for functionName, (parameters, functionBody, startingLine)
+        in SourceCodeProcessor.extractFunctionDefinitions(sourceCode).items()
+    }
+
+    calleeMap = {
+        functionName: {calleeName for calleeName, _ in findCallSites(definition.functionBody)
+                       if calleeName in functionDefinitions}
+        for functionName, definition in functionDefinitions.items()
+    }
+
+    return CallGraph(functionDefinitions, SourceCodeProcessor.extractGlobalVariables(sourceCode), calleeMap)
+
+
+def computeFunctionSummaries(callGraph: CallGraph, summaryCache: Optional[SummaryCache] = None,
+                             maxWorkers: Optional[int] = None) -> Dict[str, FunctionSummary]:
+    """Main entry point for summarising every function in a call graph"""
+    return FunctionSummarizer(callGraph).summarizeAll(summaryCache, maxWorkers)
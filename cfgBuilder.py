@@ -2,6 +2,8 @@ import re
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Tuple
 
+from callGraph import FunctionSummary, collectDeclarations, findCallSites, resolveArgumentStorage
+
 
 @dataclass
 class VariableDefinition:
@@ -11,6 +13,7 @@ class VariableDefinition:
     sourceStatement: str
     lineNumber: int
     containingBlock: Optional[str]
+    isMayDefinition: bool = False
 
 
 @dataclass
@@ -76,16 +79,19 @@ class FlowGraphConstructor:
     CONDITIONAL_PATTERNS = re.compile(r'^\s*(if|else\s*if|else|while|for)\b')
     JUMP_PATTERNS = re.compile(r'^\s*(return|break|continue|goto)\b')
 
-    def __init__(self) -> None:
+    def __init__(self, functionSummaries: Optional[Dict[str, FunctionSummary]] = None) -> None:
         self.blockIdCounter = 0
         self.definitionIdCounter = 0
         self.constructedBlocks: List[CodeBlock] = []
         self.recordedDefinitions: Dict[str, VariableDefinition] = {}
         self.variableToDefinitions: Dict[str, Set[str]] = {}
+        self.functionSummaries: Dict[str, FunctionSummary] = functionSummaries or {}
+        self.localDeclarations: Dict[str, bool] = {}
 
     def constructGraphFromSource(self, sourceBody: str, initialLine: int = 1) -> ControlFlowGraph:
         """Build a complete CFG from source code using leader-based approach"""
         processedLines = self.processSourceIntoLines(sourceBody, initialLine)
+        self.localDeclarations = collectDeclarations(lineText for lineText, _ in processedLines)
         
         if not processedLines:
             emptyBlock = self.createNewBlock()
@@ -217,13 +223,18 @@ class FlowGraphConstructor:
 
     def captureDefinitions(self, statementText: str, lineNumber: int, blockIdentifier: str) -> List[str]:
         """Extract and record variable definitions from a statement"""
-        definedVariables = self.parseDefinedVariables(statementText)
+        definedVariables = [(variableName, False) for variableName in self.parseDefinedVariables(statementText)]
+        mustDefinedNames = {variableName for variableName, _ in definedVariables}
+        # Call effects come from may-define summaries, so they never kill earlier definitions
+        definedVariables += [(variableName, True) for variableName
+                             in sorted(self.parseCallSiteDefinitions(statementText) - mustDefinedNames)]
         definitionIds = []
         
-        for variableName in definedVariables:
+        for variableName, isMayDefinition in definedVariables:
             defId = self.generateDefinitionId()
             self.recordedDefinitions[defId] = VariableDefinition(defId, variableName, 
-                                                               statementText.strip(), lineNumber, blockIdentifier)
+                                                               statementText.strip(), lineNumber, blockIdentifier,
+                                                               isMayDefinition)
             self.variableToDefinitions.setdefault(variableName, set()).add(defId)
             definitionIds.append(defId)
         
@@ -258,6 +269,26 @@ class FlowGraphConstructor:
         
         return definedVars
 
+    def parseCallSiteDefinitions(self, statementText: str) -> Set[str]:
+        """Extract variables defined by calls, using the summaries of the called functions"""
+        definedVars = set()
+        
+        for calleeName, callArguments in findCallSites(statementText):
+            calleeSummary = self.functionSummaries.get(calleeName)
+            if calleeSummary is None:
+                continue
+            
+            # Globals written by the callee (unless shadowed here), then variables reached through its pointer parameters
+            definedVars.update(calleeSummary.definedGlobals - set(self.localDeclarations))
+            arrayNames = {name for name, isArray in self.localDeclarations.items() if isArray}
+            for parameterIndex in calleeSummary.definedParameters:
+                if parameterIndex < len(callArguments):
+                    storageName = resolveArgumentStorage(callArguments[parameterIndex], arrayNames)
+                    if storageName:
+                        definedVars.add(storageName)
+        
+        return definedVars
+
     def generateDefinitionId(self) -> str:
         """Generate unique identifier for variable definitions"""
         self.definitionIdCounter += 1
@@ -271,12 +302,12 @@ class FlowGraphConstructor:
             for statement in block.codeStatements:
                 for defId in statement.associatedDefs:
                     definition = self.recordedDefinitions[defId]
-                    previousDef = latestDefinitions.get(definition.variableName)
-                    
-                    if previousDef in generatedDefs:
-                        generatedDefs.remove(previousDef)
                     
-                    latestDefinitions[definition.variableName] = defId
+                    # A may definition is generated alongside the earlier ones and kills nothing
+                    if not definition.isMayDefinition:
+                        generatedDefs = [genId for genId in generatedDefs
+                                         if self.recordedDefinitions[genId].variableName != definition.variableName]
+                        latestDefinitions[definition.variableName] = defId
                     generatedDefs.append(defId)
             
             block.generatedDefs = generatedDefs
@@ -286,14 +317,15 @@ class FlowGraphConstructor:
                 allDefsForVar = self.variableToDefinitions.get(variableName, set())
                 killedDefs.update(allDefsForVar - {latestDefId})
             
-            block.killedDefs = killedDefs
+            block.killedDefs = killedDefs - set(generatedDefs)
             block.reachingIn = set()
             block.reachingOut = set(generatedDefs)
 
 
-def constructControlFlowGraph(sourceBody: str, initialLine: int = 1) -> ControlFlowGraph:
+def constructControlFlowGraph(sourceBody: str, initialLine: int = 1,
+                              functionSummaries: Optional[Dict[str, FunctionSummary]] = None) -> ControlFlowGraph:
     """Main entry point for building a CFG from source code"""
-    return FlowGraphConstructor().constructGraphFromSource(sourceBody, initialLine)
+    return FlowGraphConstructor(functionSummaries).constructGraphFromSource(sourceBody, initialLine)
 
 
 def performReachingDefinitionsAnalysis(graph: ControlFlowGraph, 
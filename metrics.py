@@ -6,6 +6,7 @@ from typing import Dict, Iterable, List, Optional, Sequence, Set
 import matplotlib.pyplot as plt
 
 from cfgBuilder import ControlFlowGraph, VariableDefinition, CodeBlock, ControlFlowEdge, CodeStatement
+from callGraph import CallGraph, FunctionSummary
 
 
 class GraphVisualizationHandler:
@@ -69,8 +70,9 @@ class DocumentationGenerator:
         sortedDefinitions = sorted(variableDefinitions.values(), key=lambda def_obj: int(def_obj.defId[1:]))
         for definition in sortedDefinitions:
             escapedStatement = definition.sourceStatement.replace("|", "\\|")
+            mayMarker = " (may, via call)" if definition.isMayDefinition else ""
             tableRows.append(f"| {definition.defId} | {definition.variableName} | "
-                           f"{definition.containingBlock} | {definition.lineNumber} | `{escapedStatement}` |")
+                           f"{definition.containingBlock} | {definition.lineNumber} | `{escapedStatement}`{mayMarker} |")
         
         outputPath.write_text("\n".join(tableRows), encoding="utf-8")
     
@@ -106,4 +108,25 @@ class DocumentationGenerator:
             
             reportSections.append("")
         
-        outputPath.write_text("\n".join(reportSections), encoding="utf-8")
\ No newline at end of file
+        outputPath.write_text("\n".join(reportSections), encoding="utf-8")
+    
+    @staticmethod
+    def createFunctionSummariesReport(callGraph: CallGraph, functionSummaries: Dict[str, FunctionSummary],
+                                      outputPath: Path) -> None:
+        """Generate markdown table of the call graph and per-function summaries"""
+        tableRows: List[str] = [
+            "| Function | SCC | Calls | Defined Globals | Defined Parameters |",
+            "|----------|-----|-------|-----------------|--------------------|"
+        ]
+        
+        for componentIndex, component in enumerate(callGraph.computeStronglyConnectedComponents()):
+            for functionName in component:
+                summary = functionSummaries[functionName]
+                parameterNames = callGraph.functionDefinitions[functionName].parameterNames
+                definedParameters = [parameterNames[index] for index in sorted(summary.definedParameters)]
+                tableRows.append(f"| {functionName} | S{componentIndex} | "
+                               f"{', '.join(sorted(callGraph.calleeMap[functionName])) or '-'} | "
+                               f"{', '.join(sorted(summary.definedGlobals)) or '-'} | "
+                               f"{', '.join(definedParameters) or '-'} |")
+        
+        outputPath.write_text("\n".join(tableRows), encoding="utf-8")
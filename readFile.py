@@ -1,10 +1,19 @@
 import re
-from typing import Tuple
+from typing import Dict, List, Set, Tuple
 
 
 class SourceCodeProcessor:
     """Handles reading and preprocessing C source files"""
     
+    LITERAL_PATTERN = re.compile(r"\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'")
+    FUNCTION_NAME_PATTERN = re.compile(r"\b([A-Za-z_]\w*)\s*\(")
+    OPENING_BRACE_PATTERN = re.compile(r"\s*\{")
+    CONTROL_KEYWORDS = {"if", "while", "for", "switch", "do", "else", "return", "sizeof"}
+    DECLARATION_PATTERN = re.compile(
+        r"^(?:(?:const|static|extern|volatile|register|struct|union|enum|unsigned|signed|long|short)\s+)*"
+        r"(?!(?:return|else|goto|case|break|continue|typedef|struct|union|enum)\b)[A-Za-z_]\w*(?:\s+|\s*\*+\s*)([A-Za-z_*].*)$"
+    )
+    
     @staticmethod
     def loadSourceFromFile(filePath: str) -> str:
         """Load complete source code from a C file"""
@@ -31,9 +40,19 @@ class SourceCodeProcessor:
         
         return "\n".join(cleanedLines)
     
+    @classmethod
+    def blankLiterals(cls, sourceCode: str) -> str:
+        """Blank the contents of string and character literals, preserving all offsets"""
+        return cls.LITERAL_PATTERN.sub(
+            lambda literalMatch: literalMatch.group(0)[0] + " " * (len(literalMatch.group(0)) - 2)
+                                 + literalMatch.group(0)[-1],
+            sourceCode)
+    
     @classmethod
     def locateMainFunction(cls, sourceCode: str) -> Tuple[int, int]:
         """Find the boundaries of the main function in source code"""
+        # Braces inside literals must not affect matching; offsets stay valid for sourceCode
+        sourceCode = cls.blankLiterals(sourceCode)
         # Try to match standard main function signatures
         mainPattern = re.search(r"\bint\s+main\s*\([^)]*\)\s*\{", sourceCode)
         if not mainPattern:
@@ -47,6 +66,14 @@ class SourceCodeProcessor:
         if bracePosition == -1:
             raise ValueError("Invalid main function structure: missing opening brace")
         
+        closingPosition = cls.findMatchingBrace(sourceCode, bracePosition)
+        if closingPosition == -1:
+            raise ValueError("Invalid main function structure: missing closing brace")
+        return (bracePosition + 1, closingPosition)
+    
+    @staticmethod
+    def findMatchingBrace(sourceCode: str, bracePosition: int) -> int:
+        """Find the closing brace matching the opening brace at bracePosition (-1 if unbalanced)"""
         # Track brace nesting to find matching closing brace
         nestingLevel = 0
         currentPos = bracePosition
@@ -58,10 +85,10 @@ class SourceCodeProcessor:
             elif character == '}':
                 nestingLevel -= 1
                 if nestingLevel == 0:
-                    return (bracePosition + 1, currentPos)
+                    return currentPos
             currentPos += 1
         
-        raise ValueError("Invalid main function structure: missing closing brace")
+        return -1
     
     @classmethod
     def extractMainBody(cls, sourceCode: str) -> Tuple[str, int]:
@@ -70,3 +97,132 @@ class SourceCodeProcessor:
         functionBody = sourceCode[beginIndex:endIndex]
         lineNumber = sourceCode[:beginIndex].count("\n") + 1
         return functionBody, lineNumber
+    
+    @staticmethod
+    def splitTopLevel(text: str, separator: str = ",") -> List[str]:
+        """Split text on a separator, ignoring separators nested inside brackets"""
+        parts, currentPart, nestingLevel = [], [], 0
+        for character in text:
+            if character in "([{":
+                nestingLevel += 1
+            elif character in ")]}":
+                nestingLevel -= 1
+            if character == separator and nestingLevel == 0:
+                parts.append("".join(currentPart))
+                currentPart = []
+            else:
+                currentPart.append(character)
+        parts.append("".join(currentPart))
+        return [part.strip() for part in parts if part.strip()]
+    
+    @classmethod
+    def parseDeclarators(cls, statementText: str) -> List[Tuple[str, bool]]:
+        """Extract (name, isArray) pairs for the variables introduced by a declaration statement"""
+        declarationMatch = cls.DECLARATION_PATTERN.match(statementText.strip().rstrip(';'))
+        if not declarationMatch:
+            return []
+        
+        declarators = []
+        for declarator in cls.splitTopLevel(declarationMatch.group(1)):
+            declaratorName = declarator.split("=")[0]
+            nameParts = re.split(r"\s|\[", declaratorName.lstrip('*').strip())
+            if nameParts and re.fullmatch(r"[A-Za-z_]\w*", nameParts[0]):
+                declarators.append((nameParts[0], "[" in declaratorName))
+        return declarators
+    
+    @classmethod
+    def parseDeclaredNames(cls, statementText: str) -> Set[str]:
+        """Extract the variable names introduced by a declaration statement"""
+        return {declaredName for declaredName, _ in cls.parseDeclarators(statementText)}
+    
+    @classmethod
+    def parseParameterList(cls, parameterText: str) -> List[Tuple[str, bool]]:
+        """Convert a parameter list into (name, isPointer) pairs, keeping one entry per position"""
+        parameters = []
+        for parameterDecl in cls.splitTopLevel(parameterText):
+            if parameterDecl == "void" or parameterDecl == "...":
+                continue
+            # Function-pointer parameters such as int (*cb)(int) name the pointer inside parentheses
+            functionPointerMatch = re.search(r"\(\s*\*\s*([A-Za-z_]\w*)\s*\)", parameterDecl)
+            nameMatch = re.search(r"([A-Za-z_]\w*)\s*((?:\[[^\]]*\])*)$", parameterDecl)
+            if functionPointerMatch:
+                parameters.append((functionPointerMatch.group(1), True))
+            elif nameMatch:
+                isPointer = "*" in parameterDecl or bool(nameMatch.group(2))
+                parameters.append((nameMatch.group(1), isPointer))
+            else:
+                parameters.append(("", False))
+        return parameters
+    
+    @classmethod
+    def locateFunctionSpans(cls, structuralSource: str) -> List[Tuple[str, str, int, int, int]]:
+        """Find top-level functions as (name, parameter text, header start, opening brace, closing brace)"""
+        functionSpans = []
+        scanPosition = 0
+        
+        for nameMatch in cls.FUNCTION_NAME_PATTERN.finditer(structuralSource):
+            functionName = nameMatch.group(1)
+            if nameMatch.start() < scanPosition or functionName in cls.CONTROL_KEYWORDS:
+                continue
+            
+            # Balance the parameter list so nested parentheses (function pointers) are kept
+            nestingLevel, currentPos = 1, nameMatch.end()
+            while currentPos < len(structuralSource) and nestingLevel:
+                if structuralSource[currentPos] == '(':
+                    nestingLevel += 1
+                elif structuralSource[currentPos] == ')':
+                    nestingLevel -= 1
+                currentPos += 1
+            
+            braceMatch = cls.OPENING_BRACE_PATTERN.match(structuralSource, currentPos)
+            if nestingLevel or not braceMatch:
+                continue
+            
+            bracePosition = braceMatch.end() - 1
+            closingPosition = cls.findMatchingBrace(structuralSource, bracePosition)
+            if closingPosition == -1:
+                raise ValueError(f"Invalid function structure for {functionName}: missing closing brace")
+            
+            functionSpans.append((functionName, structuralSource[nameMatch.end():currentPos - 1],
+                                  nameMatch.start(), bracePosition, closingPosition))
+            scanPosition = closingPosition + 1
+        
+        return functionSpans
+    
+    @classmethod
+    def extractFunctionDefinitions(cls, sourceCode: str) -> Dict[str, Tuple[List[Tuple[str, bool]], str, int]]:
+        """Extract every top-level function as name -> (parameters, body, starting line)"""
+        functionDefinitions = {}
+        structuralSource = cls.blankLiterals(sourceCode)
+        
+        for functionName, parameterText, _, bracePosition, closingPosition in cls.locateFunctionSpans(structuralSource):
+            functionBody = sourceCode[bracePosition + 1:closingPosition]
+            lineNumber = sourceCode[:bracePosition + 1].count("\n") + 1
+            functionDefinitions[functionName] = (cls.parseParameterList(parameterText), functionBody, lineNumber)
+        
+        return functionDefinitions
+    
+    @classmethod
+    def extractGlobalVariables(cls, sourceCode: str) -> Set[str]:
+        """Find variables declared at file scope, outside functions and type definitions"""
+        # Blank out function definitions, then everything nested inside braces
+        fileScopeSource = cls.blankLiterals(sourceCode)
+        for _, _, headerStart, _, closingPosition in reversed(cls.locateFunctionSpans(fileScopeSource)):
+            fileScopeSource = fileScopeSource[:headerStart] + ";" + fileScopeSource[closingPosition + 1:]
+        
+        topLevelCharacters, nestingLevel = [], 0
+        for character in fileScopeSource:
+            if character == '{':
+                nestingLevel += 1
+            elif character == '}':
+                nestingLevel -= 1
+            elif nestingLevel == 0:
+                topLevelCharacters.append(character)
+        
+        globalNames = set()
+        for statementText in "".join(topLevelCharacters).split(";"):
+            statementText = " ".join(statementText.split())
+            if not statementText or statementText.startswith("typedef") or "(" in statementText:
+                continue
+            globalNames.update(cls.parseDeclaredNames(statementText))
+        return globalNames
@@ -1,8 +1,9 @@
 import argparse
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from readFile import SourceCodeProcessor
+from callGraph import SummaryCache, constructCallGraph, computeFunctionSummaries
 from cfgBuilder import constructControlFlowGraph, performReachingDefinitionsAnalysis, detectAmbiguousDefinitions
 from metrics import GraphVisualizationHandler, DocumentationGenerator
 
@@ -10,7 +11,9 @@ class ProgramAnalyzer:
     """Handles complete analysis of C programs"""
     
     @staticmethod
-    def processProgram(programFilePath: Path, analysisOutputDir: Path) -> Dict[str, int]:
+    def processProgram(programFilePath: Path, analysisOutputDir: Path,
+                       summaryCache: Optional[SummaryCache] = None,
+                       summaryWorkers: Optional[int] = None) -> Dict[str, int]:
         """Perform complete CFG analysis on a C program"""
         print(f"[info] Processing analysis for {programFilePath.name} ...")
         
@@ -19,8 +22,12 @@ class ProgramAnalyzer:
         processedSource = SourceCodeProcessor.cleanSourceCode(rawSourceCode)
         mainFunctionBody, startingLineNumber = SourceCodeProcessor.extractMainBody(processedSource)
         
+        # Summarise every function in the file bottom-up over the call graph
+        callGraph = constructCallGraph(processedSource)
+        functionSummaries = computeFunctionSummaries(callGraph, summaryCache, summaryWorkers)
+        
         # Build control flow graph and perform analysis
-        controlFlowGraph = constructControlFlowGraph(mainFunctionBody, startingLineNumber)
+        controlFlowGraph = constructControlFlowGraph(mainFunctionBody, startingLineNumber, functionSummaries)
         reachingDefSnapshots = performReachingDefinitionsAnalysis(controlFlowGraph)
         ambiguousVariables = detectAmbiguousDefinitions(controlFlowGraph)
 
@@ -48,6 +55,11 @@ class ProgramAnalyzer:
             controlFlowGraph, 
             programSpecificOutputDir / "reaching_definitions_iterations.md"
         )
+        DocumentationGenerator.createFunctionSummariesReport(
+            callGraph,
+            functionSummaries,
+            programSpecificOutputDir / "function_summaries.md"
+        )
 
         print(f"[completed] {programIdentifier}: Nodes={totalNodes}, Edges={totalEdges}, CC={cyclomaticComplexityValue}")
         return {
@@ -98,6 +110,19 @@ class CommandLineInterface:
             default=Path("Output"),
             help="Target directory for analysis output and reports."
         )
+        argumentParser.add_argument(
+            "--summary-cache",
+            type=Path,
+            default=None,
+            help="File used to reuse function summaries across runs (default: <output dir>/summary_cache.json)."
+        )
+        argumentParser.add_argument(
+            "--summary-workers",
+            type=int,
+            default=None,
+            help="Summarise independent call-graph components in up to this many worker processes "
+                 "(default: serial unless a level has many uncached components)."
+        )
         return argumentParser.parse_args()
     
     @classmethod
@@ -107,11 +132,14 @@ class CommandLineInterface:
         sourceFilePaths: List[Path] = commandLineArgs.sourceFiles
         analysisOutputDirectory: Path = commandLineArgs.analysis_output_dir
         analysisOutputDirectory.mkdir(parents=True, exist_ok=True)
+        summaryCache = SummaryCache(commandLineArgs.summary_cache or analysisOutputDirectory / "summary_cache.json")
 
         compiledMetrics: List[Dict[str, int]] = []
         for sourceFile in sourceFilePaths:
-            compiledMetrics.append(ProgramAnalyzer.processProgram(sourceFile, analysisOutputDirectory))
+            compiledMetrics.append(ProgramAnalyzer.processProgram(sourceFile, analysisOutputDirectory,
+                                                                  summaryCache, commandLineArgs.summary_workers))
         
+        summaryCache.save()
         MetricsReportGenerator.compileSummaryReport(compiledMetrics, analysisOutputDirectory)
 
 